@@ -0,0 +1,135 @@
+"""
+Load driver for the date extraction API.
+
+Fires requests at a running app (normally pointed at benchmarks/stub_server.py)
+and reports p50/p95/p99 latency and throughput per endpoint and concurrency level:
+
+    python benchmarks/load.py --base-url http://127.0.0.1:8000 --concurrency 1,4,16 --requests 200
+"""
+import argparse
+import json
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+from urllib.error import HTTPError, URLError
+from urllib.parse import quote, urlencode
+from urllib.request import Request, urlopen
+
+DEFAULT_TOPICS = ["Apollo 11", "French Revolution", "Roman Empire"]
+
+ENDPOINTS = ('extract-dates', 'extract-dates-multiple', 'wiki-page')
+
+
+def build_request(endpoint: str, base_url: str, topics: List[str], i: int, args: argparse.Namespace) -> Request:
+    """
+    Build the i-th request for an endpoint, cycling through the topics.
+    """
+    topic = topics[i % len(topics)]
+    if endpoint == 'extract-dates':
+        query = urlencode({'language': args.language, 'summarize': str(args.summarize).lower()})
+        return Request(f"{base_url}/extract-dates/{quote(topic)}?{query}")
+    if endpoint == 'wiki-page':
+        return Request(f"{base_url}/wiki-page/{quote(topic)}")
+    batch = [topics[(i + k) % len(topics)] for k in range(args.batch_size)]
+    body = json.dumps({'topics': batch, 'language': args.language, 'summarize': args.summarize})
+    return Request(
+        f"{base_url}/extract-dates-multiple/",
+        data=body.encode('utf-8'),
+        headers={'Content-Type': 'application/json'},
+        method='POST',
+    )
+
+
+def timed_call(request: Request, timeout: float) -> Tuple[float, bool]:
+    """
+    Send one request. Returns (latency in seconds, whether it succeeded).
+    """
+    start = time.perf_counter()
+    try:
+        with urlopen(request, timeout=timeout) as response:
+            response.read()
+            ok = response.status == 200
+    except (HTTPError, URLError, TimeoutError, ConnectionError):
+        ok = False
+    return time.perf_counter() - start, ok
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return float('nan')
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def run_level(endpoint: str, concurrency: int, args: argparse.Namespace) -> Dict:
+    """
+    Send args.requests requests to an endpoint with a fixed number of workers.
+    """
+    requests_ = [build_request(endpoint, args.base_url, args.topics, i, args) for i in range(args.requests)]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda r: timed_call(r, args.timeout), requests_))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for latency, ok in results if ok)
+    return {
+        'endpoint': endpoint,
+        'concurrency': concurrency,
+        'requests': len(results),
+        'errors': sum(1 for _, ok in results if not ok),
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p95_ms': percentile(latencies, 95) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'throughput_rps': len(latencies) / elapsed if elapsed else 0.0,
+    }
+
+
+def print_report(rows: List[Dict]):
+    header = f"{'endpoint':<24}{'conc':>6}{'reqs':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'req/s':>9}"
+    print(header)
+    print('-' * len(header))
+    for row in rows:
+        print(f"{row['endpoint']:<24}{row['concurrency']:>6}{row['requests']:>7}{row['errors']:>8}"
+              f"{row['p50_ms']:>10.1f}{row['p95_ms']:>10.1f}{row['p99_ms']:>10.1f}{row['throughput_rps']:>9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load driver for the date extraction API")
+    parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+    parser.add_argument('--endpoints', default=','.join(ENDPOINTS), help=f"comma-separated subset of {', '.join(ENDPOINTS)}")
+    parser.add_argument('--concurrency', default='1,4,16', help='comma-separated concurrency levels')
+    parser.add_argument('--requests', type=int, default=100, help='requests per endpoint and concurrency level')
+    parser.add_argument('--topics', nargs='+', default=DEFAULT_TOPICS)
+    parser.add_argument('--batch-size', type=int, default=3, help='topics per /extract-dates-multiple/ request')
+    parser.add_argument('--language', default='en')
+    parser.add_argument('--no-summarize', dest='summarize', action='store_false', help='send summarize=false')
+    parser.add_argument('--timeout', type=float, default=120)
+    parser.add_argument('--json', help='also write the results to this file')
+    args = parser.parse_args()
+    args.base_url = args.base_url.rstrip('/')
+
+    endpoints = [e for e in args.endpoints.split(',') if e]
+    unknown = set(endpoints) - set(ENDPOINTS)
+    if unknown:
+        parser.error(f"Unknown endpoints: {', '.join(sorted(unknown))}")
+
+    rows = []
+    for endpoint in endpoints:
+        for concurrency in (int(c) for c in args.concurrency.split(',')):
+            row = run_level(endpoint, concurrency, args)
+            rows.append(row)
+            print(f"  {endpoint} x{concurrency}: p50 {row['p50_ms']:.1f} ms, "
+                  f"{row['throughput_rps']:.2f} req/s, {row['errors']} errors")
+
+    print()
+    print_report(rows)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Startup-time benchmark for the FastAPI app.
+
+Times `import main` in a fresh interpreter several times, which is what an
+autoscaled worker pays on a cold start. Run from the repository root:
+
+    python benchmarks/startup.py --runs 10
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SNIPPET = (
+    "import time, sys; "
+    "start = time.perf_counter(); "
+    "import {module}; "
+    "print(time.perf_counter() - start); "
+    "print(int('langchain_google_genai' in sys.modules))"
+)
+
+
+def time_import(module: str = 'main') -> tuple:
+    """
+    Import a module in a fresh interpreter.
+    Returns (seconds, whether the Gemini client library got loaded).
+    """
+    output = subprocess.run(
+        [sys.executable, '-c', IMPORT_SNIPPET.format(module=module)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    return float(output[-2]), output[-1] == '1'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10, help='number of fresh interpreters to time')
+    parser.add_argument('--module', default='main', help='module to import')
+    args = parser.parse_args()
+
+    timings = []
+    llm_loaded = False
+    for _ in range(args.runs):
+        seconds, loaded = time_import(args.module)
+        timings.append(seconds * 1000)
+        llm_loaded = llm_loaded or loaded
+
+    print(f"import {args.module} ({args.runs} runs)")
+    print(f"  min:    {min(timings):.1f} ms")
+    print(f"  median: {statistics.median(timings):.1f} ms")
+    print(f"  max:    {max(timings):.1f} ms")
+    print(f"  langchain_google_genai loaded at import: {'yes' if llm_loaded else 'no'}")
+
+
+if __name__ == "__main__":
+    main()
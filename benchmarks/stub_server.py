@@ -0,0 +1,230 @@
+"""
+Local stand-ins for Wikipedia and Gemini, for offline load testing.
+
+Replays recorded MediaWiki search/revision responses from a fixtures file and
+answers Gemini generateContent calls with a fake timeline built from the
+prompt. Both backends get configurable latency and error rates.
+
+Serve the stubs:
+
+    python benchmarks/stub_server.py serve --port 8001 --llm-latency-ms 800 --llm-error-rate 0.02
+
+Then point the app at them:
+
+    WIKI_API_URL=http://127.0.0.1:8001/w/api.php \\
+    GEMINI_API_ENDPOINT=http://127.0.0.1:8001 \\
+    GOOGLE_API_KEY=stub TOPIC_DELAY_SECONDS=0 \\
+    uvicorn main:app --port 8000
+
+Record more pages from the live API (needs network access):
+
+    python benchmarks/stub_server.py record "Apollo 11" "French Revolution"
+"""
+import argparse
+import json
+import os
+import random
+import re
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Union
+from urllib.parse import parse_qs, urlparse
+
+DEFAULT_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'wikipedia.json')
+
+GEMINI_PATH = re.compile(r'^/v1(?:beta)?/models/[^/:]+:generateContent$')
+
+
+def load_fixtures(path: str) -> Dict[str, Dict]:
+    """
+    Load recorded responses: {"search": {topic: response}, "revisions": {title: response}}.
+    """
+    with open(path, encoding='utf-8') as f:
+        fixtures = json.load(f)
+    if not fixtures.get('revisions'):
+        raise ValueError(f"No recorded revisions in {path}")
+    return fixtures
+
+
+def fake_timeline(request_body: Dict) -> Union[List[Dict[str, str]], Dict[str, List[Dict[str, str]]]]:
+    """
+    Build the JSON Gemini would return from the "- date: context" lines of the
+    prompt, so the app's response parsing is exercised for real. Batched prompts
+    ("### tN: <topic>" sections) get a JSON object keyed by tN, others an array.
+    """
+    texts = [
+        part.get('text', '')
+        for content in request_body.get('contents', [])
+        for part in content.get('parts', [])
+    ]
+    timelines = {}
+    events = []
+    for line in '\n'.join(texts).splitlines():
+        section = re.match(r'^### (t\d+): ', line)
+        if section:
+            events = timelines.setdefault(section.group(1), [])
+            continue
+        match = re.match(r'^- ([^:]+): (.*)$', line)
+        if match:
+            date, context = match.groups()
+            events.append({'date': date.strip(), 'summary': context.strip()[:200]})
+    return timelines or events
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    # Set by make_server()
+    fixtures: Dict[str, Dict] = {}
+    options: argparse.Namespace = None
+
+    def log_message(self, format, *args):
+        if self.options.verbose:
+            super().log_message(format, *args)
+
+    def _delay(self, mean_ms: float):
+        if mean_ms > 0:
+            jitter = self.options.jitter
+            time.sleep(max(0.0, random.uniform(1 - jitter, 1 + jitter) * mean_ms / 1000))
+
+    def _send_json(self, status: int, payload: Dict):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != '/w/api.php':
+            self._send_json(404, {'error': f"Unknown path {url.path}"})
+            return
+
+        self._delay(self.options.wiki_latency_ms)
+        if random.random() < self.options.wiki_error_rate:
+            self._send_json(503, {'error': {'code': 'stub-unavailable', 'info': 'Injected error'}})
+            return
+
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        search, revisions = self.fixtures.get('search', {}), self.fixtures['revisions']
+
+        if params.get('list') == 'search':
+            topic = params.get('srsearch', '').lower()
+            # Unknown topics resolve to a recorded page so any topic list can be replayed
+            response = search.get(topic) or next(iter(search.values()), None)
+            if response is None:
+                title = next(iter(revisions))
+                response = {'query': {'search': [{'ns': 0, 'title': title}]}}
+            self._send_json(200, response)
+        elif params.get('prop') == 'revisions':
+            title = params.get('titles', '')
+            self._send_json(200, revisions.get(title) or next(iter(revisions.values())))
+        else:
+            self._send_json(400, {'error': {'code': 'badparams', 'info': 'Unsupported stub query'}})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        length = int(self.headers.get('Content-Length', 0))
+        raw_body = self.rfile.read(length) if length else b'{}'
+
+        if not GEMINI_PATH.match(url.path):
+            self._send_json(404, {'error': {'code': 404, 'message': f"Unknown path {url.path}", 'status': 'NOT_FOUND'}})
+            return
+
+        self._delay(self.options.llm_latency_ms)
+        if random.random() < self.options.llm_error_rate:
+            self._send_json(503, {'error': {'code': 503, 'message': 'Injected error', 'status': 'UNAVAILABLE'}})
+            return
+
+        events = fake_timeline(json.loads(raw_body or b'{}'))
+        text = json.dumps(events)
+        self._send_json(200, {
+            'candidates': [{
+                'content': {'parts': [{'text': text}], 'role': 'model'},
+                'finishReason': 'STOP',
+                'index': 0,
+            }],
+            'usageMetadata': {
+                'promptTokenCount': len(raw_body) // 4,
+                'candidatesTokenCount': len(text) // 4,
+                'totalTokenCount': (len(raw_body) + len(text)) // 4,
+            },
+            'modelVersion': 'stub',
+        })
+
+
+def make_server(options: argparse.Namespace) -> ThreadingHTTPServer:
+    StubHandler.fixtures = load_fixtures(options.fixtures)
+    StubHandler.options = options
+    return ThreadingHTTPServer((options.host, options.port), StubHandler)
+
+
+def record(topics: List[str], path: str, language: str = 'en', user_agent: str = 'haas (sharmasuhas450@gmail.com)'):
+    """
+    Fetch live search and revision responses for topics and merge them into the fixtures file.
+    """
+    import requests
+
+    url = f"https://{language}.wikipedia.org/w/api.php"
+    headers = {'User-Agent': user_agent}
+    fixtures = {'search': {}, 'revisions': {}}
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            fixtures = json.load(f)
+
+    for topic in topics:
+        search = requests.get(url, headers=headers, params={
+            'action': 'query', 'list': 'search', 'srsearch': topic, 'format': 'json'
+        }).json()
+        fixtures['search'][topic.lower()] = search
+        title = search['query']['search'][0]['title']
+        fixtures['revisions'][title] = requests.get(url, headers=headers, params={
+            'action': 'query', 'titles': title, 'prop': 'revisions',
+            'rvprop': 'content', 'rvslots': '*', 'format': 'json'
+        }).json()
+        print(f"Recorded {topic} -> {title}")
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(fixtures, f, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Wikipedia and Gemini stand-ins")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve = commands.add_parser('serve', help='serve the stub backends')
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8001)
+    serve.add_argument('--fixtures', default=DEFAULT_FIXTURES, help='recorded MediaWiki responses')
+    serve.add_argument('--wiki-latency-ms', type=float, default=50, help='mean Wikipedia response latency')
+    serve.add_argument('--llm-latency-ms', type=float, default=800, help='mean Gemini response latency')
+    serve.add_argument('--jitter', type=float, default=0.2, help='latency jitter as a fraction of the mean')
+    serve.add_argument('--wiki-error-rate', type=float, default=0.0, help='fraction of Wikipedia calls that fail')
+    serve.add_argument('--llm-error-rate', type=float, default=0.0, help='fraction of Gemini calls that fail')
+    serve.add_argument('--verbose', action='store_true', help='log every request')
+
+    rec = commands.add_parser('record', help='record live Wikipedia responses into the fixtures file')
+    rec.add_argument('topics', nargs='+')
+    rec.add_argument('--fixtures', default=DEFAULT_FIXTURES)
+    rec.add_argument('--language', default='en')
+
+    args = parser.parse_args()
+    if args.command == 'record':
+        record(args.topics, args.fixtures, args.language)
+        return
+
+    server = make_server(args)
+    print(f"Stub backends on http://{args.host}:{args.port} "
+          f"(wiki {args.wiki_latency_ms:g} ms / {args.wiki_error_rate:.0%} errors, "
+          f"llm {args.llm_latency_ms:g} ms / {args.llm_error_rate:.0%} errors)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+import os
+
+# MediaWiki API endpoint; {language} is replaced with the wiki language code.
+# Point this at benchmarks/stub_server.py to run without wikipedia.org.
+WIKI_API_URL = os.environ.get("WIKI_API_URL", "https://{language}.wikipedia.org/w/api.php")
+
+# Gemini API endpoint override (e.g. "http://127.0.0.1:8001" for the local stub).
+# Empty means the default Google endpoint.
+GEMINI_API_ENDPOINT = os.environ.get("GEMINI_API_ENDPOINT", "")
+
+# Prompt token budget for one batched multi-topic Gemini call
+LLM_BATCH_TOKEN_BUDGET = int(os.environ.get("LLM_BATCH_TOKEN_BUDGET", "20000"))
+
+# Maximum number of topics summarized in one batched Gemini call
+LLM_BATCH_MAX_TOPICS = int(os.environ.get("LLM_BATCH_MAX_TOPICS", "8"))
+
+# Delay between topics in multi-topic requests, to be respectful to APIs
+TOPIC_DELAY_SECONDS = float(os.environ.get("TOPIC_DELAY_SECONDS", "1"))
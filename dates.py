@@ -1,6 +1,8 @@
 import re
 from typing import Dict, List, Tuple, Union
 import requests
+from config import WIKI_API_URL
+from grammars import get_date_scanner
 from wiki_name import get_wikipedia_page_name_from_topic
 
 
@@ -13,7 +15,7 @@ def extract_dates_from_topic(topic: str, language: str = 'en', user_agent: str =
         
         # Step 1: Get Wikipedia page name from topic
         print("  - Finding Wikipedia page...")
-        page_name = get_wikipedia_page_name_from_topic(topic)
+        page_name = get_wikipedia_page_name_from_topic(topic, language)
         print(f"  - Found page: {page_name}")
         
         # Step 2: Get RAW page content (minimal cleaning)
@@ -23,7 +25,7 @@ def extract_dates_from_topic(topic: str, language: str = 'en', user_agent: str =
         
         # Step 3: Extract ALL dates aggressively
         print("  - Extracting dates aggressively...")
-        dates_dict = extract_all_dates_aggressive(raw_text)
+        dates_dict = extract_all_dates_aggressive(raw_text, language)
         print(f"  - Found {len(dates_dict)} unique dates with context")
         
         return {
@@ -43,13 +45,15 @@ def extract_dates_from_topic(topic: str, language: str = 'en', user_agent: str =
         }
 
 
-def normalize_date_aggressive(date_str: str) -> str:
+def normalize_date_aggressive(date_str: str, language: str = 'en') -> str:
     """
     Normalize dates aggressively - keep more original information.
+    Month names, era and circa markers are read using the language's grammar.
     """
     if not date_str:
         return date_str
         
+    scanner = get_date_scanner(language)
     original = date_str
     date_str = date_str.strip()
     
@@ -57,64 +61,63 @@ def normalize_date_aggressive(date_str: str) -> str:
     year_match = re.search(r'(1[0-9]{3}|2[0-9]{3})', date_str)
     if not year_match:
         # Try for BC/AD dates without specific year
-        bc_match = re.search(r'(\d+)\s*(BC|BCE)', date_str, re.IGNORECASE)
-        if bc_match:
-            num, era = bc_match.groups()
-            return f"{-int(num)} {era.upper()}"
+        num_match = re.search(r'(\d+)', date_str)
+        bc_match = scanner.bce.search(date_str)
+        if num_match and bc_match:
+            era = bc_match.group(1).upper()
+            return f"{-int(num_match.group(1))} {era if era in ('BC', 'BCE') else 'BCE'}"
         
-        ad_match = re.search(r'(\d+)\s*(AD|CE)', date_str, re.IGNORECASE)
-        if ad_match:
-            num, era = ad_match.groups()
-            return f"{num} {era.upper()}"
+        ad_match = scanner.ce.search(date_str)
+        if num_match and ad_match:
+            era = ad_match.group(1).upper()
+            return f"{num_match.group(1)} {era if era in ('AD', 'CE') else 'CE'}"
         
         return original
     
     year = year_match.group(1)
     
     # Handle circa
-    circa = 'c. ' if re.search(r'\bc\.?\s*', date_str, re.IGNORECASE) else ''
+    circa = 'c. ' if scanner.circa.search(date_str) else ''
     
     # Handle BC/BCE
-    if re.search(r'\b(BC|BCE)\b', date_str, re.IGNORECASE):
+    if scanner.bce.search(date_str):
         return f"{circa}{-int(year)} BCE"
     
     # Handle AD/CE  
-    if re.search(r'\b(AD|CE)\b', date_str, re.IGNORECASE):
+    if scanner.ce.search(date_str):
         return f"{circa}{year} CE"
     
     # Handle decades
-    if date_str.endswith('s') and re.match(r'.*\d{4}s', date_str):
+    if scanner.decade.search(date_str):
         return f"{circa}{year}s"
     
     # Handle full dates - try to extract month and day
-    month_map = {
-        'january': '01', 'february': '02', 'march': '03', 'april': '04',
-        'may': '05', 'june': '06', 'july': '07', 'august': '08',
-        'september': '09', 'october': '10', 'november': '11', 'december': '12'
-    }
-    
-    # Try to extract month and day
-    for month_name, month_num in month_map.items():
-        if month_name in date_str.lower():
-            day_match = re.search(r'(\d{1,2})(?:\s|,|$)', date_str)
-            day = day_match.group(1) if day_match else '01'
-            return f"{circa}{year}-{month_num}-{day.zfill(2)}"
+    month_match = scanner.month.search(date_str)
+    if month_match:
+        month_num = scanner.months[month_match.group(1).lower()]
+        day_match = scanner.day.search(date_str)
+        day = day_match.group(1) if day_match else '01'
+        return f"{circa}{year}-{month_num}-{day.zfill(2)}"
     
     # Handle ISO dates
     iso_match = re.search(r'(\d{4})-(\d{2})-(\d{2})', date_str)
     if iso_match:
         return f"{circa}{year}-{iso_match.group(2)}-{iso_match.group(3)}"
     
-    # Handle slash dates (assume MM/DD/YYYY)
+    # Handle slash dates (MM/DD/YYYY, or DD/MM/YYYY for day-first languages)
     slash_match = re.search(r'(\d{1,2})/(\d{1,2})/(\d{4})', date_str)
     if slash_match:
         month, day, _ = slash_match.groups()
+        if scanner.day_first:
+            month, day = day, month
         return f"{circa}{year}-{month.zfill(2)}-{day.zfill(2)}"
     
     # Handle ranges
-    range_match = re.search(r'(\d{4})[-–](\d{4}|present)', date_str)
+    range_match = scanner.range.search(date_str)
     if range_match:
         start, end = range_match.groups()
+        if not end.isdigit():
+            end = 'present'
         return f"{circa}{start}-{end}"
     
     # Default: just the year
@@ -173,63 +176,41 @@ def extract_extensive_context(text: str, start_pos: int, end_pos: int, max_lengt
     context = re.sub(r'\n+', ' \n', context)
     
     return context.strip()[:max_length]
-def extract_all_dates_aggressive(text: str) -> Dict[str, str]:
+def scan_date_matches(text: str, language: str = 'en') -> List[re.Match]:
+    """
+    Run every pattern of the language's grammar over the text.
+    Keeps the first match found at each position, in text order.
+    """
+    scanner = get_date_scanner(language)
+    
+    # Collect ALL matches from all patterns
+    all_matches = {}
+    for pattern in scanner.patterns:
+        matches = list(pattern.finditer(text))
+        for match in matches:
+            if match.start() not in all_matches:
+                all_matches[match.start()] = match
+    
+    return [all_matches[pos] for pos in sorted(all_matches)]
+
+def extract_all_dates_aggressive(text: str, language: str = 'en') -> Dict[str, str]:
     """
     Extract ALL possible dates using aggressive pattern matching on raw text.
+    Patterns come from the language's precompiled grammar (see grammars.py).
     """
     if not text:
         return {}
     
-    date_patterns = [
-        # Years: 1999, 2000, 2023, etc. (any 4-digit number 1000-2999)
-        r'\b(1[0-9]{3}|2[0-9]{3})\b',
-        
-        # Years in parentheses/brackets: (1999), [2000], (c. 1999)
-        r'[\[(](c\.?\s*)?(1[0-9]{3}|2[0-9]{3})[\])]',
-        
-        # Full dates: January 15, 2023 or 15 January 2023
-        r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s*(?:1[0-9]{3}|2[0-9]{3})\b',
-        r'\b\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+(?:1[0-9]{3}|2[0-9]{3})\b',
-        
-        # ISO dates: 2023-01-15
-        r'\b(?:1[0-9]{3}|2[0-9]{3})-\d{2}-\d{2}\b',
-        
-        # Slash dates: 01/15/2023, 15/01/2023
-        r'\b\d{1,2}/\d{1,2}/(?:1[0-9]{3}|2[0-9]{3})\b',
-        
-        # Decades: 1990s, 2000s
-        r'\b(?:19|20)\d{2}s\b',
-        
-        # BC/AD dates: 1999 BC, 200 AD
-        r'\b(?:1[0-9]{3}|2[0-9]{3})\s*(?:BC|BCE|AD|CE)\b',
-        r'\b\d+\s*(?:BC|BCE|AD|CE)\b',
-        
-        # Circa dates: c. 1999, c.2000
-        r'\bc\.?\s*(?:1[0-9]{3}|2[0-9]{3})\b',
-        
-        # Date ranges: 1999-2000, 1999–2000, 1999–present
-        r'\b(?:1[0-9]{3}|2[0-9]{3})[-–](?:1[0-9]{3}|2[0-9]{3}|present)\b',
-        
-        # Years with punctuation: 1999., 2000;, 2023:
-        r'\b(?:1[0-9]{3}|2[0-9]{3})[.,;:]\b',
-    ]
-    
-    
     dates_dict = {}
     processed_regions = []  # Track processed regions to avoid overlaps
     
-    # Collect ALL matches from all patterns
-    all_matches = {}
-    for pattern in date_patterns:
-        matches = list(re.finditer(pattern, text, re.IGNORECASE))
-        for match in matches:
-            if match.start() not in all_matches:
-                all_matches[match.start()] = match
+    all_matches = scan_date_matches(text, language)
     
     print(f"  - Found {len(all_matches)} raw date matches")
     
     # Process matches in order
-    for i, (pos, match) in enumerate(sorted(all_matches.items())):
+    for i, match in enumerate(all_matches):
+        pos = match.start()
         # Check if this position overlaps with already processed regions
         overlap = False
         for (start, end) in processed_regions:
@@ -241,7 +222,7 @@ def extract_all_dates_aggressive(text: str) -> Dict[str, str]:
             continue
             
         original_date = match.group()
-        normalized_date = normalize_date_aggressive(original_date)
+        normalized_date = normalize_date_aggressive(original_date, language)
         
         # Use smarter context extraction
         context = extract_extensive_context(text, match.start(), match.end())
@@ -263,7 +244,7 @@ def get_raw_page_content(page_title: str, language: str = 'en', user_agent: str
     Get RAW Wikipedia page content with minimal cleaning.
     """
     headers = {'User-Agent': user_agent}
-    url = f"https://{language}.wikipedia.org/w/api.php"
+    url = WIKI_API_URL.format(language=language)
     
     # Get raw wikitext - this contains ALL the content
     params = {
@@ -401,8 +382,8 @@ def sort_dates_chronologically(dates_dict: Dict[str, str]) -> Dict[str, str]:
 
 
 # Keep compatibility functions
-def extract_dates(text: str) -> List[Dict[str, str]]:
-    dates_dict = extract_all_dates_aggressive(text)
+def extract_dates(text: str, language: str = 'en') -> List[Dict[str, str]]:
+    dates_dict = extract_all_dates_aggressive(text, language)
     return [{'date': date, 'context': context} for date, context in dates_dict.items()]
 
 
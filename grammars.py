@@ -0,0 +1,204 @@
+import re
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Pattern
+
+# Shared year fragment: any 4-digit number 1000-2999
+YEAR = r'(?:1[0-9]{3}|2[0-9]{3})'
+
+# Language grammar registry. Each entry is plain data (regex fragments and
+# month names) so registering a language costs nothing at import time; the
+# fragments are only compiled when the language is first requested.
+#
+#   months   - lowercase month name -> two-digit month number
+#   orders   - full-date layouts found on that Wikipedia ('mdy', 'dmy')
+#   joiner   - what separates day, month and year in a 'dmy' date
+#   ordinal  - what may follow the day number ('1er', '15.', '1º')
+#   day      - day token inside a full date (group 1 is the day number)
+#   bce/ce   - era markers (regex fragments)
+#   circa    - circa markers (regex fragments)
+#   decade   - (prefix, suffix) around a decade year, e.g. 'années 1990', '1990er'
+#   present  - words used as the open end of a range (1999-present)
+#   day_first - whether slash dates are DD/MM/YYYY
+GRAMMARS: Dict[str, Dict] = {
+    'en': {
+        'months': {
+            'january': '01', 'february': '02', 'march': '03', 'april': '04',
+            'may': '05', 'june': '06', 'july': '07', 'august': '08',
+            'september': '09', 'october': '10', 'november': '11', 'december': '12'
+        },
+        'orders': ('mdy', 'dmy'),
+        'joiner': r'\s+',
+        'ordinal': '',
+        'day': r'(\d{1,2})(?:\s|,|$)',
+        'bce': [r'BCE', r'BC'],
+        'ce': [r'AD', r'CE'],
+        'circa': [r'c\.?'],
+        'decade': ('', r's'),
+        'present': ['present'],
+        'day_first': False,
+    },
+    'es': {
+        'months': {
+            'enero': '01', 'febrero': '02', 'marzo': '03', 'abril': '04',
+            'mayo': '05', 'junio': '06', 'julio': '07', 'agosto': '08',
+            'septiembre': '09', 'setiembre': '09', 'octubre': '10',
+            'noviembre': '11', 'diciembre': '12'
+        },
+        'orders': ('dmy',),
+        'joiner': r'\s+(?:de\s+)?',
+        'ordinal': r'(?:º|°)?',
+        'day': r'(\d{1,2})(?:º|°)?\s',
+        'bce': [r'a\.\s*(?:de\s*)?C\.?', r'a\.\s*n\.\s*e\.?'],
+        'ce': [r'd\.\s*(?:de\s*)?C\.?', r'd\.\s*n\.\s*e\.?'],
+        'circa': [r'(?:ca?\.|hacia)(?=\s*\d)'],
+        'decade': (r'(?:años|década\s+de)\s+', ''),
+        'present': ['presente', 'actualidad'],
+        'day_first': True,
+    },
+    'fr': {
+        'months': {
+            'janvier': '01', 'février': '02', 'fevrier': '02', 'mars': '03',
+            'avril': '04', 'mai': '05', 'juin': '06', 'juillet': '07',
+            'août': '08', 'aout': '08', 'septembre': '09', 'octobre': '10',
+            'novembre': '11', 'décembre': '12', 'decembre': '12'
+        },
+        'orders': ('dmy',),
+        'joiner': r'\s+',
+        'ordinal': r'(?:er)?',
+        'day': r'(\d{1,2})(?:er)?\s',
+        'bce': [r'av\.\s*J\.?-C\.?', r'avant\s+J\.?-C\.?'],
+        'ce': [r'apr\.\s*J\.?-C\.?', r'ap\.\s*J\.?-C\.?', r'après\s+J\.?-C\.?'],
+        'circa': [r'(?:v\.|vers|env\.|c\.)(?=\s*\d)'],
+        'decade': (r'années\s+', ''),
+        'present': ['présent', 'aujourd\'hui'],
+        'day_first': True,
+    },
+    'de': {
+        'months': {
+            'januar': '01', 'jänner': '01', 'februar': '02', 'märz': '03',
+            'april': '04', 'mai': '05', 'juni': '06', 'juli': '07',
+            'august': '08', 'september': '09', 'oktober': '10',
+            'november': '11', 'dezember': '12'
+        },
+        'orders': ('dmy',),
+        'joiner': r'\s+',
+        'ordinal': r'\.?',
+        'day': r'(\d{1,2})\.?\s',
+        'bce': [r'v\.\s*Chr\.?', r'v\.\s*u\.\s*Z\.?'],
+        'ce': [r'n\.\s*Chr\.?', r'n\.\s*u\.\s*Z\.?'],
+        'circa': [r'(?:ca\.|um)(?=\s*\d)'],
+        'decade': ('', r'er(?:\s+Jahre)?'),
+        'present': ['heute'],
+        'day_first': True,
+    },
+}
+
+DEFAULT_LANGUAGE = 'en'
+
+
+class DateScanner(NamedTuple):
+    """Compiled date grammar for a single language."""
+    language: str
+    months: Dict[str, str]
+    day_first: bool
+    patterns: List[Pattern]
+    month: Pattern
+    day: Pattern
+    bce: Pattern
+    ce: Pattern
+    circa: Pattern
+    decade: Pattern
+    range: Pattern
+    year_token: Pattern
+
+
+def _alternation(fragments: List[str]) -> str:
+    return '|'.join(fragments)
+
+
+def _compile_grammar(language: str, grammar: Dict) -> DateScanner:
+    """
+    Build every regex a language needs in one go.
+    """
+    flags = re.IGNORECASE
+    # Longest names first so 'septiembre' wins over a shorter prefix
+    months = _alternation(sorted(map(re.escape, grammar['months']), key=len, reverse=True))
+    bce = _alternation(grammar['bce'])
+    ce = _alternation(grammar['ce'])
+    era = f'{bce}|{ce}'
+    circa = _alternation(grammar['circa'])
+    present = _alternation(map(re.escape, grammar['present']))
+    decade_prefix, decade_suffix = grammar['decade']
+    joiner = grammar['joiner']
+    ordinal = grammar['ordinal']
+
+    patterns = [
+        # Years: 1999, 2000, 2023, etc.
+        rf'\b{YEAR}\b',
+
+        # Years in parentheses/brackets: (1999), [2000], (c. 1999)
+        rf'[\[(]((?:{circa})\s*)?{YEAR}[\])]',
+    ]
+
+    # Full dates: January 15, 2023 / 15 January 2023 / 15 de enero de 2023 / 15. Januar 2023
+    if 'mdy' in grammar['orders']:
+        patterns.append(rf'\b(?:{months})\s+\d{{1,2}},?\s*{YEAR}\b')
+    if 'dmy' in grammar['orders']:
+        patterns.append(rf'\b\d{{1,2}}{ordinal}{joiner}(?:{months}){joiner}{YEAR}\b')
+
+    patterns += [
+        # ISO dates: 2023-01-15
+        rf'\b{YEAR}-\d{{2}}-\d{{2}}\b',
+
+        # Slash dates: 01/15/2023, 15/01/2023
+        rf'\b\d{{1,2}}/\d{{1,2}}/{YEAR}\b',
+
+        # Decades: 1990s, 1990er, années 1990, años 1990
+        rf'\b{decade_prefix}(?:19|20)\d{{2}}{decade_suffix}\b',
+
+        # Era dates: 1999 BC, 200 AD, 44 av. J.-C., 753 v. Chr.
+        rf'\b{YEAR}\s*(?:{era})(?!\w)',
+        rf'\b\d+\s*(?:{era})(?!\w)',
+
+        # Circa dates: c. 1999, vers 1500, um 1800
+        rf'\b(?:{circa})\s*{YEAR}\b',
+
+        # Date ranges: 1999-2000, 1999–2000, 1999–present
+        rf'\b{YEAR}[-–](?:{YEAR}|{present})\b',
+
+        # Years with punctuation: 1999., 2000;, 2023:
+        rf'\b{YEAR}[.,;:]\b',
+    ]
+
+    return DateScanner(
+        language=language,
+        months=grammar['months'],
+        day_first=grammar['day_first'],
+        patterns=[re.compile(p, flags) for p in patterns],
+        month=re.compile(f'({months})', flags),
+        day=re.compile(grammar['day']),
+        bce=re.compile(rf'\b({bce})(?!\w)', flags),
+        ce=re.compile(rf'\b({ce})(?!\w)', flags),
+        circa=re.compile(rf'\b(?:{circa})\s*', flags),
+        decade=re.compile(rf'{decade_prefix}\d{{4}}{decade_suffix}$', flags),
+        range=re.compile(rf'(\d{{4}})[-–](\d{{4}}|{present})', flags),
+        # Signed year in one pass: group 1 is a year followed by an era marker
+        # (group 2 set when BCE), group 3 a bare 4-digit year
+        year_token=re.compile(rf'\b(\d+)\s*(?:({bce})|(?:{ce}))(?!\w)|(?<!\d)({YEAR})(?!\d)', flags),
+    )
+
+
+@lru_cache(maxsize=None)
+def _compiled_scanner(language: str) -> DateScanner:
+    # Only ever called with keys of GRAMMARS, so the cache stays bounded
+    return _compile_grammar(language, GRAMMARS[language])
+
+
+def get_date_scanner(language: str = DEFAULT_LANGUAGE) -> DateScanner:
+    """
+    Get the compiled date scanner for a language, compiling it on first use.
+    Unknown languages fall back to the English grammar.
+    """
+    if language not in GRAMMARS:
+        language = DEFAULT_LANGUAGE
+    return _compiled_scanner(language)
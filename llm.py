@@ -1,52 +1,126 @@
 import os
+import threading
+from typing import Dict, List, Tuple
 
+from config import (
+    GEMINI_API_ENDPOINT,
+    LLM_BATCH_MAX_TOPICS,
+    LLM_BATCH_TOKEN_BUDGET,
+    TOPIC_DELAY_SECONDS,
+)
 from dates import extract_dates_from_topic
 
-if "GOOGLE_API_KEY" not in os.environ:
-    os.environ["GOOGLE_API_KEY"] = " "
+# The Gemini client is created on first use (not at import time) and then
+# shared by every request; it is safe to use from several threads at once.
+_llm = None
+_llm_lock = threading.Lock()
+
+
+def _create_llm():
+    """Build a Gemini chat client. Imports langchain only when first needed."""
+    if "GOOGLE_API_KEY" not in os.environ:
+        os.environ["GOOGLE_API_KEY"] = " "
+
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    endpoint_options = {}
+    if GEMINI_API_ENDPOINT:
+        # REST transport so plain-HTTP endpoints such as the local stub work
+        endpoint_options = {
+            "client_options": {"api_endpoint": GEMINI_API_ENDPOINT},
+            "transport": "rest",
+        }
+
+    return ChatGoogleGenerativeAI(
+        model="gemini-2.5-flash",
+        temperature=0,
+        max_tokens=None,
+        timeout=None,
+        max_retries=2,
+        **endpoint_options,
+    )
+
 
-from langchain_google_genai import ChatGoogleGenerativeAI
+def get_llm():
+    """Return the shared Gemini client, building it on the first call."""
+    global _llm
+    if _llm is None:
+        with _llm_lock:
+            # Re-check so concurrent first calls build only one client
+            if _llm is None:
+                _llm = _create_llm()
+    return _llm
 
-llm = ChatGoogleGenerativeAI(
-    model="gemini-2.5-flash",
-    temperature=0,
-    max_tokens=None,
-    timeout=None,
-    max_retries=2,
+TIMELINE_RULES = (
+    "You are a precise historical event analyzer. "
+    "Given dated sentences from Wikipedia, you must create a comprehensive timeline:\n"
+    "Rules:\n"
+    "1. Process EVERY date mentioned - do not skip any dates\n"
+    "2. Keep dates in their original format exactly as they appear\n"
+    "3. Merge related events on the same date\n"
+    "4. Preserve ALL historical context and details\n"
+    "5. Create clear, informative summaries that capture the full context\n"
+    "6. NEVER add information not present in the source text\n"
 )
 
-def process_gemini(topic:str, language:str='en'):
-    data = extract_dates_from_topic(topic, language)
+SYSTEM_PROMPT = (
+    TIMELINE_RULES +
+    "7. IMPORTANT: Return ONLY a JSON array with this exact structure:\n"
+    '[\n  {"date": "YYYY-MM-DD", "summary": "Detailed event summary with full context"},\n'
+    '   {"date": "YYYY", "summary": "Another detailed event"}\n]\n'
+    "8. Process dates in chronological order\n"
+    "9. Include BCE/CE dates if present\n"
+    "10. Include date ranges and approximate dates (c., circa)\n"
+    "\n- Return ONLY the JSON array, no other text"
+)
+
+BATCH_SYSTEM_PROMPT = (
+    TIMELINE_RULES +
+    "7. You will receive several topics, each introduced by a line '### <key>: <topic>'. "
+    "Build a separate timeline for each topic from its own events only\n"
+    "8. IMPORTANT: Return ONLY a JSON object keyed by the topic keys, with this exact structure:\n"
+    '{\n  "t0": [{"date": "YYYY-MM-DD", "summary": "Detailed event summary with full context"}],\n'
+    '  "t1": [{"date": "YYYY", "summary": "Another detailed event"}]\n}\n'
+    "9. Include every key you were given, process dates in chronological order\n"
+    "10. Include BCE/CE dates and date ranges and approximate dates (c., circa)\n"
+    "\n- Return ONLY the JSON object, no other text"
+)
+
+# Number of extracted dates sent to the model per topic
+MAX_EVENTS_PER_TOPIC = 30
+
+
+def format_events(data: dict) -> str:
+    """Render a topic's extracted dates as '- date: context' lines for the prompt."""
+    return "\n".join(
+        [f"- {date}: {context}" for date, context in list(data['dates'].items())[:MAX_EVENTS_PER_TOPIC]]
+    )
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about 4 characters per token) used for batch budgeting."""
+    return len(text) // 4 + 1
+
+
+def summarize_dates(data: dict):
+    """Summarize one topic's extracted dates into a list of date-summary objects."""
     messages = [
-        (
-            "system",
-            "You are a precise historical event analyzer. "
-            "Given dated sentences from Wikipedia, you must create a comprehensive timeline:\n"
-            "Rules:\n"
-            "1. Process EVERY date mentioned - do not skip any dates\n"
-            "2. Keep dates in their original format exactly as they appear\n"
-            "3. Merge related events on the same date\n"
-            "4. Preserve ALL historical context and details\n"
-            "5. Create clear, informative summaries that capture the full context\n"
-            "6. NEVER add information not present in the source text\n"
-            "7. IMPORTANT: Return ONLY a JSON array with this exact structure:\n"
-            '[\n  {"date": "YYYY-MM-DD", "summary": "Detailed event summary with full context"},\n'
-            '   {"date": "YYYY", "summary": "Another detailed event"}\n]\n'
-            "8. Process dates in chronological order\n"
-            "9. Include BCE/CE dates if present\n"
-            "10. Include date ranges and approximate dates (c., circa)\n"
-            "\n- Return ONLY the JSON array, no other text"
-        ),
+        ("system", SYSTEM_PROMPT),
         (
             "human",
-            f"Topic: {data['topic']}\n\nExtracted events:\n" +
-            "\n".join(
-                [f"- {date}: {context}" for date, context in list(data['dates'].items())[:30]]
-            ),
+            f"Topic: {data['topic']}\n\nExtracted events:\n" + format_events(data),
         ),
     ]
-    ai_msg = llm.invoke(messages)
-    parsed_response=parse_gemini_response(ai_msg)
+    ai_msg = get_llm().invoke(messages)
+    return parse_gemini_response(ai_msg)
+
+
+def process_gemini(topic:str, language:str='en', summarize:bool=True):
+    data = extract_dates_from_topic(topic, language)
+    if not summarize:
+        # Raw dates only - skip the LLM stage entirely
+        return {**data, 'parsed_data': []}
+    parsed_response = summarize_dates(data)
     return {
             'topic': topic,
             'wikipedia_page': data['wikipedia_page'],
@@ -55,7 +129,117 @@ def process_gemini(topic:str, language:str='en'):
             'dates': data['dates'],
             'parsed_data':parsed_response,
         }
-    
+
+
+def pack_batches(items: List[Tuple[str, str]], token_budget: int = LLM_BATCH_TOKEN_BUDGET,
+                 max_topics: int = LLM_BATCH_MAX_TOPICS) -> List[List[Tuple[str, str]]]:
+    """
+    Greedily pack (key, prompt section) pairs into batches that stay under the
+    token budget. A section larger than the budget gets a batch of its own.
+    """
+    budget = token_budget - estimate_tokens(BATCH_SYSTEM_PROMPT)
+    batches, current, used = [], [], 0
+    for key, section in items:
+        cost = estimate_tokens(section)
+        if current and (used + cost > budget or len(current) >= max_topics):
+            batches.append(current)
+            current, used = [], 0
+        current.append((key, section))
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def summarize_batch(batch: List[Tuple[str, str]]) -> Dict[str, list]:
+    """
+    Summarize several topics in one model call.
+    Returns parsed events for every key the model answered correctly.
+    """
+    messages = [
+        ("system", BATCH_SYSTEM_PROMPT),
+        ("human", "\n\n".join(section for _, section in batch)),
+    ]
+    ai_msg = get_llm().invoke(messages)
+    return parse_gemini_batch_response(ai_msg, [key for key, _ in batch])
+
+
+def process_gemini_batch(topics: List[str], language: str = 'en', summarize: bool = True) -> List[dict]:
+    """
+    Extract dates for several topics and summarize them with as few model calls
+    as possible: topics are packed into token-budgeted batches with a keyed JSON
+    response, and only topics missing from a batch answer are retried one by one.
+    """
+    import time
+
+    results = []
+    for i, topic in enumerate(topics):
+        if i:
+            # Small delay to be respectful to APIs
+            time.sleep(TOPIC_DELAY_SECONDS)
+        data = extract_dates_from_topic(topic, language)
+        results.append({**data, 'parsed_data': []})
+
+    if not summarize:
+        return results
+
+    # Topics that failed extraction or found nothing have nothing to summarize
+    pending = {
+        f"t{i}": result for i, result in enumerate(results)
+        if 'error' not in result and result['dates']
+    }
+    sections = [
+        (key, f"### {key}: {result['topic']}\n" + format_events(result))
+        for key, result in pending.items()
+    ]
+
+    retry = []
+    for batch in pack_batches(sections):
+        try:
+            parsed = summarize_batch(batch)
+        except Exception as e:
+            print(f"Warning: Batched Gemini call failed: {str(e)}")
+            parsed = {}
+        for key, _ in batch:
+            # An empty list is a valid answer; only unanswered keys are retried
+            if key in parsed:
+                pending[key]['parsed_data'] = parsed[key]
+            else:
+                retry.append(key)
+
+    # Retry individual topics the batch call did not answer
+    for key in retry:
+        try:
+            pending[key]['parsed_data'] = summarize_dates(pending[key])
+        except Exception as e:
+            print(f"Warning: Gemini processing failed for topic '{pending[key]['topic']}': {str(e)}")
+
+    return results
+
+
+def _extract_json(content: str, opening: str, closing: str) -> str:
+    """Trim any surrounding text from a JSON array/object in a model response."""
+    if content.find(opening) != 0:
+        start = content.find(opening)
+        end = content.rfind(closing)
+        if start == -1 or end == -1:
+            return ''
+        content = content[start:end+1]
+    return content
+
+
+def _clean_events(events) -> list:
+    """Keep only well-formed {'date', 'summary'} events."""
+    valid_events = []
+    for event in events:
+        if isinstance(event, dict) and 'date' in event and 'summary' in event:
+            valid_events.append({
+                'date': str(event['date']).strip(),
+                'summary': str(event['summary']).strip()
+            })
+    return valid_events
+
+
 def parse_gemini_response(response):
     """Parse and validate the Gemini response into a list of date-summary objects."""
     import json
@@ -70,14 +254,11 @@ def parse_gemini_response(response):
     
     try:
         # Try to find JSON array in the response if there's surrounding text
-        if content.find('[') != 0:  # Response doesn't start with [
-            start = content.find('[')
-            end = content.rfind(']')
-            if start != -1 and end != -1:
-                content = content[start:end+1]
-            else:
-                print(f"Warning: Could not find JSON array in response: {content[:100]}...")
-                return []
+        array = _extract_json(content, '[', ']')
+        if not array:
+            print(f"Warning: Could not find JSON array in response: {content[:100]}...")
+            return []
+        content = array
         
         # Parse the JSON
         events = json.loads(content)
@@ -88,13 +269,7 @@ def parse_gemini_response(response):
             return []
             
         # Validate and clean each event
-        valid_events = []
-        for event in events:
-            if isinstance(event, dict) and 'date' in event and 'summary' in event:
-                valid_events.append({
-                    'date': str(event['date']).strip(),
-                    'summary': str(event['summary']).strip()
-                })
+        valid_events = _clean_events(events)
         print(valid_events)
         return valid_events
     except json.JSONDecodeError as e:
@@ -103,4 +278,39 @@ def parse_gemini_response(response):
         return []  # Return empty list instead of raising error
     except Exception as e:
         print(f"Warning: Unexpected error parsing Gemini response: {str(e)}")
-        return []  # Return empty list instead of raising error
\ No newline at end of file
+        return []  # Return empty list instead of raising error
+
+
+def parse_gemini_batch_response(response, keys: List[str]) -> Dict[str, list]:
+    """
+    Parse a batched Gemini response (a JSON object keyed by topic key) into
+    per-topic event lists. Keys that are missing or malformed are left out
+    so the caller can retry those topics on their own.
+    """
+    import json
+
+    content = response.content.strip()
+    if not content:
+        print("Warning: Empty batched response from Gemini")
+        return {}
+
+    content = _extract_json(content, '{', '}')
+    try:
+        answer = json.loads(content) if content else None
+    except json.JSONDecodeError as e:
+        print(f"Warning: Failed to parse batched Gemini response: {str(e)}")
+        return {}
+
+    if not isinstance(answer, dict):
+        print("Warning: Batched Gemini response is not a JSON object")
+        return {}
+
+    parsed = {}
+    for key in keys:
+        events = answer.get(key)
+        if isinstance(events, list):
+            parsed[key] = _clean_events(events)
+    missing = [key for key in keys if key not in parsed]
+    if missing:
+        print(f"Warning: Batched Gemini response missing topics: {', '.join(missing)}")
+    return parsed
@@ -2,9 +2,9 @@ from typing import Union, List, Dict
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-import wikipediaapi
+from config import TOPIC_DELAY_SECONDS
 from dates import extract_dates_from_topic
-from llm import process_gemini
+from llm import process_gemini, process_gemini_batch
 from wiki_name import get_wikipedia_page_name_from_topic
 
 app = FastAPI()
@@ -20,13 +20,14 @@ async def read_root(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
 @app.get("/extract-dates/{topic}")
-def get_dates_dict(topic: str, language: str = 'en'):
+def get_dates_dict(topic: str, language: str = 'en', summarize: bool = True):
     """
     GET function to extract dates dictionary from Wikipedia page for a given topic
+    Pass summarize=false to skip the Gemini stage and get raw dates only
     Returns: Dictionary with dates as keys and context as values
     """
     try:
-        result = process_gemini(topic, language)
+        result = process_gemini(topic, language, summarize)
         
         if 'error' in result:
             raise HTTPException(status_code=404, detail=result['error'])
@@ -42,11 +43,13 @@ def get_dates_dict(topic: str, language: str = 'en'):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 class TopicsRequest(BaseModel):
     topics: List[str]
     language: str = 'en'
+    summarize: bool = True
+    batch: bool = True
 
 @app.post("/extract-dates-multiple/")
 def extract_dates_multiple_topics(request: TopicsRequest):
@@ -55,17 +58,27 @@ def extract_dates_multiple_topics(request: TopicsRequest):
     Request body should contain:
     {
         "topics": ["topic1", "topic2", ...],
-        "language": "en"  # optional, defaults to 'en'
+        "language": "en",  # optional, defaults to 'en'
+        "summarize": true,  # optional, false skips the Gemini stage
+        "batch": true  # optional, false summarizes each topic in its own Gemini call
     }
     """
     try:
+        if request.batch:
+            # Summarize all topics in a handful of token-budgeted Gemini calls
+            results = process_gemini_batch(request.topics, request.language, request.summarize)
+            return {
+                "total_topics": len(results),
+                "results": results
+            }
+
         results = []
         
         for topic in request.topics:
             # Use the Gemini-based processor so we get the summarized/parsed events
             # (this returns the same fields as extract_dates_from_topic plus `parsed_data`)
             try:
-                result = process_gemini(topic, request.language)
+                result = process_gemini(topic, request.language, request.summarize)
             except Exception:
                 # Fall back to the original extractor if Gemini processing fails for a topic
                 result = extract_dates_from_topic(topic, request.language)
@@ -73,7 +86,7 @@ def extract_dates_multiple_topics(request: TopicsRequest):
             
             # Small delay to be respectful to APIs
             import time
-            time.sleep(1)
+            time.sleep(TOPIC_DELAY_SECONDS)
         
         return {
             "total_topics": len(results),
@@ -82,13 +95,40 @@ def extract_dates_multiple_topics(request: TopicsRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+class StatsRequest(BaseModel):
+    topics: List[str] = Field(..., min_length=1, max_length=50)
+    language: str = 'en'
+    bins: int = Field(20, gt=0, le=1000)
+    gap_years: int = Field(25, ge=0)
+
+@app.post("/stats")
+def get_coverage_stats(request: StatsRequest):
+    """
+    POST function to compute date coverage statistics over one or more topics
+    Request body should contain:
+    {
+        "topics": ["topic1", "topic2", ...],  # 1 to 50 topics
+        "language": "en",  # optional, defaults to 'en'
+        "bins": 20,  # optional, number of density bins along each page (1-1000)
+        "gap_years": 25  # optional, report timeline gaps longer than this
+    }
+    Returns per-topic decade histograms, dates per KB (overall, along the page
+    and per section), timeline gaps, and the same totals aggregated over all topics
+    """
+    try:
+        # NumPy is only loaded once statistics are first requested
+        from stats import coverage_stats
+        return coverage_stats(request.topics, request.language, request.bins, request.gap_years)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
 @app.get("/wiki-page/{topic}")
-def get_wiki_page_name(topic: str):
+def get_wiki_page_name(topic: str, language: str = 'en'):
     """
     GET function to get Wikipedia page name for a topic
     """
     try:
-        page_name = get_wikipedia_page_name_from_topic(topic)
+        page_name = get_wikipedia_page_name_from_topic(topic, language)
         return {
             "topic": topic,
             "wikipedia_page": page_name
@@ -116,6 +156,6 @@ def process_multiple_topics(topics: List[str], language: str = 'en', user_agent:
         
         # Small delay to be respectful to APIs
         import time
-        time.sleep(1)
+        time.sleep(TOPIC_DELAY_SECONDS)
     
     return results
\ No newline at end of file
@@ -0,0 +1,175 @@
+import re
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from config import TOPIC_DELAY_SECONDS
+from dates import get_raw_page_content, scan_date_matches
+from grammars import get_date_scanner
+from wiki_name import get_wikipedia_page_name_from_topic
+
+# Wikitext section headings: == History ==, === Early life ===
+SECTION_HEADING = re.compile(r'^(={2,6})\s*(.+?)\s*\1\s*$', re.MULTILINE)
+
+
+def year_tokens(text: str, language: str = 'en') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find every year in the text in a single regex pass.
+    Returns (offsets, signed years), with BCE years negative.
+    """
+    scanner = get_date_scanner(language)
+    tokens = [
+        (t.start(), -int(t.group(1)) if t.group(2) else int(t.group(1) or t.group(3)))
+        for t in scanner.year_token.finditer(text)
+    ]
+    if not tokens:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    offsets, years = np.array(tokens, dtype=np.int64).T
+    return offsets, years
+
+
+def date_arrays(text: str, language: str = 'en') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Scan text for dates and return (years, offsets) as NumPy arrays.
+    Matches nested inside an earlier, longer match (the '2023' inside
+    'January 15, 2023') are dropped so each date is counted once. The kept
+    matches are joined and tokenized for years in one pass, and each match
+    takes the first year token inside it.
+    """
+    empty = np.empty(0, dtype=np.int64)
+    matches = scan_date_matches(text, language)
+    if not matches:
+        return empty, empty
+
+    starts = np.fromiter((m.start() for m in matches), dtype=np.int64, count=len(matches))
+    ends = np.fromiter((m.end() for m in matches), dtype=np.int64, count=len(matches))
+
+    keep = np.flatnonzero(np.concatenate(([True], starts[1:] >= np.maximum.accumulate(ends)[:-1])))
+    starts, lengths = starts[keep], ends[keep] - starts[keep]
+
+    # '\x00' is neither a digit, a word character nor whitespace, so no year
+    # or era token can run from one match into the next
+    joined = '\x00'.join(matches[i].group() for i in keep)
+    segment_starts = np.concatenate(([0], np.cumsum(lengths + 1)[:-1]))
+
+    token_offsets, token_years = year_tokens(joined, language)
+    if not len(token_offsets):
+        return empty, empty
+
+    first_token = np.minimum(np.searchsorted(token_offsets, segment_starts), len(token_offsets) - 1)
+    has_year = token_offsets[first_token] - segment_starts
+    has_year = (has_year >= 0) & (has_year < lengths)
+
+    return token_years[first_token[has_year]], starts[has_year]
+
+
+def section_bounds(text: str) -> Tuple[np.ndarray, List[str]]:
+    """
+    Get the start offset and title of every section, with the lead section first.
+    """
+    headings = list(SECTION_HEADING.finditer(text))
+    starts = np.array([0] + [h.start() for h in headings], dtype=np.int64)
+    titles = ['Introduction'] + [h.group(2) for h in headings]
+    return starts, titles
+
+
+def decade_histogram(years: np.ndarray) -> Dict[int, int]:
+    """Count dates per decade (BCE years fall into negative decades)."""
+    decades, counts = np.unique((years // 10) * 10, return_counts=True)
+    return dict(zip(decades.tolist(), counts.tolist()))
+
+
+def find_gaps(years: np.ndarray, gap_years: int) -> List[Dict[str, int]]:
+    """Find stretches longer than gap_years with no dates between consecutive mentioned years."""
+    unique_years = np.unique(years)
+    spans = np.diff(unique_years)
+    gaps = np.flatnonzero(spans > gap_years)
+    return [
+        {'from': int(unique_years[i]), 'to': int(unique_years[i + 1]), 'years': int(spans[i])}
+        for i in gaps
+    ]
+
+
+def compute_coverage(text: str, years: np.ndarray, offsets: np.ndarray, bins: int = 20, gap_years: int = 25) -> Dict:
+    """
+    Coverage statistics for one page: decade histogram, dates per KB overall,
+    along the page and per section, and gaps in the timeline.
+    """
+    text_length = len(text)
+    text_kb = max(text_length, 1) / 1024
+
+    counts, edges = np.histogram(offsets, bins=bins, range=(0, max(text_length, 1)))
+    bin_kb = (edges[1] - edges[0]) / 1024
+
+    section_starts, section_titles = section_bounds(text)
+    section_ends = np.append(section_starts[1:], text_length)
+    section_lengths = section_ends - section_starts
+    section_counts = np.bincount(
+        np.searchsorted(section_starts, offsets, side='right') - 1,
+        minlength=len(section_starts),
+    )
+    section_density = section_counts / np.maximum(section_lengths, 1) * 1024
+
+    return {
+        'text_length': text_length,
+        'dates_total': int(len(years)),
+        'dates_per_kb': round(len(years) / text_kb, 3),
+        'year_range': [int(years.min()), int(years.max())] if len(years) else [],
+        'decades': decade_histogram(years),
+        'density': {
+            'bin_kb': round(float(bin_kb), 3),
+            'dates_per_kb': np.round(counts / bin_kb, 3).tolist() if bin_kb else counts.tolist(),
+        },
+        'sections': [
+            {'title': title, 'length': int(length), 'dates': int(count), 'dates_per_kb': round(float(density), 3)}
+            for title, length, count, density in zip(section_titles, section_lengths, section_counts, section_density)
+        ],
+        'gaps': find_gaps(years, gap_years),
+    }
+
+
+def topic_coverage(topic: str, language: str = 'en', bins: int = 20, gap_years: int = 25) -> Tuple[Dict, np.ndarray]:
+    """
+    Fetch a topic's page and compute its coverage statistics.
+    Returns (stats, years) so callers can aggregate the raw years.
+    """
+    try:
+        page_name = get_wikipedia_page_name_from_topic(topic, language)
+        text = get_raw_page_content(page_name, language)
+        years, offsets = date_arrays(text, language)
+        stats = compute_coverage(text, years, offsets, bins, gap_years)
+        return {'topic': topic, 'wikipedia_page': page_name, **stats}, years
+    except Exception as e:
+        print(f"Error computing stats for topic '{topic}': {e}")
+        return {'topic': topic, 'error': str(e)}, np.empty(0, dtype=np.int64)
+
+
+def coverage_stats(topics: List[str], language: str = 'en', bins: int = 20, gap_years: int = 25) -> Dict:
+    """
+    Coverage statistics for each topic plus an aggregate over all of them.
+    """
+    results, all_years = [], []
+    total_length = 0
+    for i, topic in enumerate(topics):
+        if i:
+            # Small delay to be respectful to APIs
+            time.sleep(TOPIC_DELAY_SECONDS)
+        stats, years = topic_coverage(topic, language, bins, gap_years)
+        results.append(stats)
+        all_years.append(years)
+        total_length += stats.get('text_length', 0)
+
+    years = np.concatenate(all_years) if all_years else np.empty(0, dtype=np.int64)
+    return {
+        'total_topics': len(results),
+        'topics': results,
+        'aggregate': {
+            'text_length': total_length,
+            'dates_total': int(len(years)),
+            'dates_per_kb': round(len(years) / (total_length / 1024), 3) if total_length else 0.0,
+            'year_range': [int(years.min()), int(years.max())] if len(years) else [],
+            'decades': decade_histogram(years),
+            'gaps': find_gaps(years, gap_years),
+        },
+    }
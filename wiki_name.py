@@ -1,11 +1,12 @@
-import wikipediaapi
 import requests
 
-def wikipedia_search(topic: str,user_agent: str = 'haas (sharmasuhas450@gmail.com)'):
+from config import WIKI_API_URL
+
+def wikipedia_search(topic: str,user_agent: str = 'haas (sharmasuhas450@gmail.com)', language: str = 'en'):
     """
-    Search using Wikipedia API directly
+    Search using Wikipedia API directly, on the given language's Wikipedia
     """
-    url = "https://en.wikipedia.org/w/api.php"
+    url = WIKI_API_URL.format(language=language)
     
     headers = {
         'User-Agent': user_agent
@@ -40,17 +41,18 @@ def extract_wikipedia_page_name(search_results):
     
     return None
 
-def get_wikipedia_page_name_from_topic(topic: str) -> str:
+def get_wikipedia_page_name_from_topic(topic: str, language: str = 'en') -> str:
     """
     Convert a topic name to a valid Wikipedia page title using Wikipedia search API.
     
     Args:
         topic (str): The topic name (e.g., "python programming", "world war 2")
+        language (str): Language code of the Wikipedia to search
     
     Returns:
         str: Valid Wikipedia page title
     """
-    search_results = wikipedia_search(topic)
+    search_results = wikipedia_search(topic, language=language)
     
     if not search_results:
         raise ValueError(f"No search results found for topic: {topic}")